@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import inspect
+import types
 from typing import TYPE_CHECKING
 
-from .func import asyncify_func
+from .func import asyncify_func, _is_coroutine_function
 
 if TYPE_CHECKING:
     from ._types import CallableT, TypeT
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 __all__ = ('asyncify_class', 'ignore')
 
 
+_FUNCTION_TYPES = frozenset((types.FunctionType, staticmethod, classmethod))
+
+
 def ignore(func: CallableT) -> CallableT:
     """|deco|
 
@@ -26,7 +30,13 @@ def asyncify_class(cls: TypeT) -> TypeT:
 
     Turn a classes methods into async functions.
     This uses :func:`asyncify.asyncify_func`.
-    This ignores methods marked with :func:`asyncify.ignore` and `dunder` methods.
+    This ignores methods marked with :func:`asyncify.ignore`, `dunder` methods
+    and methods that are already coroutine functions.
+    Methods wrapped in :class:`staticmethod` or :class:`classmethod` keep their descriptor.
+
+    .. versionchanged:: 2.1
+        Attributes are read from each class dict in the MRO instead of
+        :func:`inspect.getmembers`, and static/class methods are now wrapped.
 
     Example
     ---------
@@ -59,11 +69,30 @@ def asyncify_class(cls: TypeT) -> TypeT:
     if not TYPE_CHECKING and not inspect.isclass(cls):
         raise TypeError(f'Expected class, got {cls.__class__.__name__!r}')
 
-    for name, func in inspect.getmembers(cls):
-        if not inspect.isfunction(func) or getattr(func, '_asyncify_ignore', False) or name.startswith('__'):
-            continue
+    seen = set()
+
+    for c in cls.__mro__:
+        for name, func in c.__dict__.items():
+            if name.startswith('__') or name in seen:
+                continue
+
+            seen.add(name)
+
+            func_type = type(func)
+            if func_type not in _FUNCTION_TYPES:
+                continue
+
+            # staticmethod/classmethod store the real function on __func__;
+            # wrapping the descriptor itself would break it
+            inner = func if func_type is types.FunctionType else func.__func__
+
+            if getattr(inner, '_asyncify_ignore', False):
+                continue
+
+            if getattr(inner, '_asyncify_wrapped', False) or _is_coroutine_function(inner):
+                continue
 
-        func = asyncify_func(func)
-        setattr(cls, name, func)
+            inner = asyncify_func(inner)
+            setattr(cls, name, inner if func_type is types.FunctionType else func_type(inner))
 
     return cls
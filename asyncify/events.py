@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import functools
 import inspect
 import sys
-from typing import TYPE_CHECKING, Any, Callable, Dict, Set, Tuple, Type, TypeVar
+import types
+from typing import TYPE_CHECKING, Any, Callable, Dict, Type, TypeVar
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
@@ -21,72 +21,66 @@ else:
     P = TypeVar('P')
 
 
-_VALID_NAMES: Tuple[str, ...] = (
-    'get_event_loop',
-    'set_event_loop',
-    'new_event_loop',
-    'get_child_watcher',
-    'set_child_watcher',
+_VALID_NAMES = frozenset(
+    {
+        'get_event_loop',
+        'set_event_loop',
+        'new_event_loop',
+        'get_child_watcher',
+        'set_child_watcher',
+    }
 )
 
+if sys.platform == 'win32':
+    _WINDOWS_FORBIDDEN = frozenset({'get_child_watcher', 'set_child_watcher'})
+else:
+    _WINDOWS_FORBIDDEN = frozenset()
 
-class EventsEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
-    """
-    Call a functions whenever certain things happen in asyncio!
-    This is done using the event loop policy.
-
-    Example
-    ---------
-    .. code:: py
-
-        import asyncio
-        import asyncify
-
-        policy = asyncify.EventsEventLoopPolicy()
-
-        @policy.event
-        def new_event_loop():
-            print('New event loop being created.')
-
-        asyncio.set_event_loop_policy(policy)
-
-
-        async def main():
-            ...
-
-        asyncio.run(main())  # prints 'New event loop being created.'
-        # asyncio.run creates an event loop with `new_event_loop`
-
-    .. warning::
-        `asyncio.get_event_loop` won't call its event if there is a running and set event loop.
-
-    .. versionadded:: 1.1
-    """
 
-    _olds: Dict[str, Callable[..., Any]] = {}
+class _EventsPolicyMixin:
+    # the event machinery lives here so that EventsEventLoopPolicy.with_base
+    # can pair it with any concrete policy class
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self._set_olds()
-        self._registered_events: Set[str] = set()
-
-    @classmethod
-    def _set_olds(cls) -> None:
-        cls._olds['get_event_loop'] = cls.get_event_loop
-        cls._olds['set_event_loop'] = cls.set_event_loop
-        cls._olds['new_event_loop'] = cls.new_event_loop
-
-        if hasattr(cls, 'get_child_watcher'):
-            cls._olds['get_child_watcher'] = cls.get_child_watcher
-        if hasattr(cls, 'set_child_watcher'):
-            cls._olds['set_child_watcher'] = cls.set_child_watcher
+        self._events: Dict[str, Callable[..., Any]] = {}
 
     def __repr__(self) -> str:
         return (
-            f'<EventsEventLoopPolicy base={self.__class__.__bases__[0]!r},'
-            f' registered_events={self._registered_events!r}>'
+            f'<{self.__class__.__name__} base={self.__class__.__bases__[-1]!r},'
+            f' registered_events={set(self._events)!r}>'
         )
 
+    def get_event_loop(self) -> asyncio.AbstractEventLoop:
+        event = self._events.get('get_event_loop')
+        if event is not None:
+            event()
+        return super().get_event_loop()
+
+    def set_event_loop(self, loop: Any) -> None:
+        event = self._events.get('set_event_loop')
+        if event is not None:
+            event(loop)
+        super().set_event_loop(loop)
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        event = self._events.get('new_event_loop')
+        if event is not None:
+            event()
+        return super().new_event_loop()
+
+    def get_child_watcher(self) -> Any:
+        event = self._events.get('get_child_watcher')
+        if event is not None:
+            event()
+        return super().get_child_watcher()  # type: ignore # not available on Windows
+
+    def set_child_watcher(self, watcher: Any) -> None:
+        event = self._events.get('set_child_watcher')
+        if event is not None:
+            event(watcher)
+        super().set_child_watcher(watcher)  # type: ignore # not available on Windows
+
     def event(self, func: Callable[P, T]) -> Callable[P, T]:
         """|deco|
 
@@ -117,17 +111,14 @@ class EventsEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
             raise TypeError(f'Expected a callable, got {func.__class__.__name__!r}')
 
         if func.__name__ not in _VALID_NAMES:
-            raise RuntimeError(f'{func.__name__!r} is not a valid function name. {_VALID_NAMES} are valid.')
+            raise RuntimeError(
+                f'{func.__name__!r} is not a valid function name. {tuple(sorted(_VALID_NAMES))} are valid.'
+            )
 
-        old: Callable[..., Any] = getattr(super(), func.__name__)
+        if func.__name__ in _WINDOWS_FORBIDDEN:
+            raise RuntimeError(f'{func.__name__!r} is not supported on Windows.')
 
-        @functools.wraps(old)
-        def updated(*args: P.args, **kwargs: P.kwargs) -> Any:
-            func(*args, **kwargs)
-            return old(*args, **kwargs)
-
-        setattr(self, old.__name__, updated)
-        self._registered_events.add(old.__name__)
+        self._events[func.__name__] = func
 
         return func
 
@@ -145,19 +136,56 @@ class EventsEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
         RuntimeError
             `name` is not a registered event.
         """
-        if name not in self._registered_events:
+        if name not in self._events:
             raise RuntimeError(f'{name!r} is not a registered event.')
 
-        setattr(self, name, self._olds[name])
-        self._registered_events.remove(name)
+        del self._events[name]
+
+
+class EventsEventLoopPolicy(_EventsPolicyMixin, asyncio.DefaultEventLoopPolicy):
+    """
+    Call a functions whenever certain things happen in asyncio!
+    This is done using the event loop policy.
+
+    Example
+    ---------
+    .. code:: py
+
+        import asyncio
+        import asyncify
+
+        policy = asyncify.EventsEventLoopPolicy()
+
+        @policy.event
+        def new_event_loop():
+            print('New event loop being created.')
+
+        asyncio.set_event_loop_policy(policy)
+
+
+        async def main():
+            ...
+
+        asyncio.run(main())  # prints 'New event loop being created.'
+        # asyncio.run creates an event loop with `new_event_loop`
+
+    .. warning::
+        `asyncio.get_event_loop` won't call its event if there is a running and set event loop.
+
+    .. versionadded:: 1.1
+    """
 
     @classmethod
-    def change_base_policy(cls, policy_cls: Type[asyncio.AbstractEventLoopPolicy]) -> None:
+    def with_base(cls, policy_cls: Type[asyncio.AbstractEventLoopPolicy]) -> Type[_EventsPolicyMixin]:
         """
         The actual things the event loop policy does are based on your platform.
         The default base loop policy is
-        `asyncio.DefaultLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html#asyncio.DefaultEventLoopPolicy>`_
-        but can be changed.
+        `asyncio.DefaultLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html#asyncio.DefaultEventLoopPolicy>`_.
+        This creates a new policy class with a different base.
+
+        .. versionadded:: 2.1
+            Replaces `change_base_policy`, which mutated this class in place
+            and was removed in this version.
 
         Parameters
         ------------
@@ -176,9 +204,7 @@ class EventsEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
             import asyncify
             import uvloop
 
-            asyncify.EventsEventLoopPolicy.change_base_policy(uvloop.EventLoopPolicy)
-
-            policy = asyncify.EventsEventLoopPolicy()
+            policy = asyncify.EventsEventLoopPolicy.with_base(uvloop.EventLoopPolicy)()
 
             @policy.event
             def new_event_loop():
@@ -192,8 +218,7 @@ class EventsEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
         TypeError
             `policy_cls` does not inherit from `asyncio.AbstractEventLoopPolicy`.
         """
-        if asyncio.AbstractEventLoop not in policy_cls.__bases__:
-            raise TypeError('policy_cls must inherited from asyncio.AbstractEventLoopPolicy.')
+        if not (isinstance(policy_cls, type) and issubclass(policy_cls, asyncio.AbstractEventLoopPolicy)):
+            raise TypeError('policy_cls must inherit from asyncio.AbstractEventLoopPolicy.')
 
-        cls.__bases__: Tuple[Type[Any], ...] = (policy_cls, *cls.__bases__[1:])
-        cls._set_olds()
+        return types.new_class(cls.__name__, (_EventsPolicyMixin, policy_cls))
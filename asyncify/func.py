@@ -3,10 +3,14 @@ from __future__ import annotations
 import asyncio
 import inspect
 import functools
+import threading
 
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, TypeVar, Optional
 
+from ._sentinel import MISSING
+
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from typing_extensions import ParamSpec, Self
     from ._types import Coro
 
@@ -14,20 +18,123 @@ if TYPE_CHECKING:
 __all__ = ('asyncify_func', 'syncify_func', 'taskify_func')
 
 
+# bound at import so the wrapper skips the module attribute lookup per call
+_get_running_loop = asyncio.get_running_loop
+
+_CO_COROUTINE_FLAGS = 0x180  # CO_COROUTINE | CO_ITERABLE_COROUTINE
+_COROUTINE_MARKER = getattr(asyncio.coroutines, '_is_coroutine', None)
+# set by inspect.markcoroutinefunction on 3.12+
+_INSPECT_COROUTINE_MARKER = getattr(inspect, '_is_coroutine_marker', None)
+
+
+def _copy_metadata(wrapper: Any, wrapped: Any) -> None:
+    # the parts of functools.wraps we actually need, without the
+    # WRAPPER_ASSIGNMENTS iteration and __dict__ update per decoration
+    try:
+        wrapper.__name__ = wrapped.__name__
+        wrapper.__qualname__ = wrapped.__qualname__
+        wrapper.__doc__ = wrapped.__doc__
+    except AttributeError:
+        pass
+    wrapper.__wrapped__ = wrapped
+
+
+# names the generated wrapper uses itself, so parameters may not shadow them
+_SPECIALIZE_RESERVED = frozenset({'loop', '_func', '_executor', '_get_running_loop'})
+
+
+def _specialize_async_func(
+    func: Callable[..., Any], executor: Optional[Executor]
+) -> Optional[Callable[..., Any]]:
+    # build an exact-arity wrapper so calls skip *args/**kwargs packing;
+    # returns None when the signature is not a plain fixed positional one
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return None
+
+    names = []
+    for param in parameters.values():
+        if param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD or param.default is not param.empty:
+            return None
+        names.append(param.name)
+
+    if not _SPECIALIZE_RESERVED.isdisjoint(names):
+        return None
+
+    params = ', '.join(names)
+    args = f', {params}' if params else ''
+    namespace: Dict[str, Any] = {
+        '_func': func,
+        '_executor': executor,
+        '_get_running_loop': _get_running_loop,
+    }
+    exec(
+        f'async def async_func({params}):\n'
+        f'    loop = _get_running_loop()\n'
+        f'    return await loop.run_in_executor(_executor, _func{args})\n',
+        namespace,
+    )
+    return namespace['async_func']
+
+
+def _is_coroutine_function(func: Any) -> bool:
+    # Cheaper than inspect.iscoroutinefunction, which unwraps functools.wraps
+    # chains and runs isfunction before ever looking at co_flags.
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_flags & _CO_COROUTINE_FLAGS:
+        return True
+    if _COROUTINE_MARKER is not None and getattr(func, '_is_coroutine', None) is _COROUTINE_MARKER:
+        return True
+    if (
+        _INSPECT_COROUTINE_MARKER is not None
+        and getattr(func, '_is_coroutine_marker', None) is _INSPECT_COROUTINE_MARKER
+    ):
+        return True
+    # callables without a code object (e.g. functools.partial of a coroutine
+    # function) get the slow path, which knows how to unwrap them
+    return code is None and inspect.iscoroutinefunction(func)
+
+
 T = TypeVar('T')
 T_ret = TypeVar('T_ret')
 
+
+_sync_loops = threading.local()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    # one lazily created loop per thread reused across syncified calls;
+    # sharing a single loop would race when threads run it concurrently
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(_sync_loops, 'loop', None)
+
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _sync_loops.loop = loop
+    return loop
+
+
 if TYPE_CHECKING:
     P = ParamSpec('P')
 else:
     P = TypeVar('P')
 
 
-def asyncify_func(func: Callable[P, T]) -> Callable[P, Coro[T]]:
+def asyncify_func(
+    func: Callable[P, T] = MISSING, *, executor: Optional[Executor] = None
+) -> Callable[P, Coro[T]]:
     """|deco|
 
     Make a synchronous function into an asynchronous function by running it in a separate thread.
 
+    Parameters
+    ----------
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to run the function in. Defaults to ``None``, the loop's default executor.
+        Pass one :class:`concurrent.futures.ThreadPoolExecutor` to several wrappers to share a pool.
+
+        .. versionadded:: 2.1
+
     Example
     --------
     .. code:: py
@@ -48,24 +155,47 @@ def asyncify_func(func: Callable[P, T]) -> Callable[P, Coro[T]]:
         # this is very useful to turn a blocking library into an async library
         get = asyncify.asyncify_func(requests.get)
 
+        # an executor can be pinned with the keyword form
+        @asyncify.asyncify_func(executor=concurrent.futures.ThreadPoolExecutor(max_workers=32))
+        def get(url):
+            return requests.get(url).text
+
     .. note::
-        This function uses the default loop executor.
+        When no executor is passed, this function uses the default loop executor.
         Change it with `loop.set_default_executor <https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.set_default_executor>`_.
 
+    .. note::
+        A function that is already a coroutine function is returned unchanged.
+
     Raises
     -------
     TypeError
-        The object passed in was not a function.
+        The object passed in was not callable.
     """
-    if not inspect.isfunction(func):
-        raise TypeError(f'Expected a callable function, got {func.__class__.__name__!r}')
+    if func is MISSING:
+        # used as @asyncify_func(...) with arguments
+        return functools.partial(asyncify_func, executor=executor)  # type: ignore
+
+    if not callable(func):
+        raise TypeError(f'Expected a callable, got {func.__class__.__name__!r}')
+
+    if _is_coroutine_function(func):
+        # wrapping would hand the coroutine object to a thread unawaited
+        return func
 
-    @functools.wraps(func)
-    async def async_func(*args: P.args, **kwargs: P.kwargs) -> T:
-        new_func = functools.partial(func, *args, **kwargs)
+    async_func = _specialize_async_func(func, executor)
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, new_func)
+    if async_func is None:
+
+        async def async_func(*args: P.args, **kwargs: P.kwargs) -> T:
+            loop = _get_running_loop()
+
+            if kwargs:
+                return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            return await loop.run_in_executor(executor, func, *args)
+
+    _copy_metadata(async_func, func)
+    async_func._asyncify_wrapped = True  # type: ignore # we are assigning new attribute here
 
     return async_func
 
@@ -96,24 +226,26 @@ def syncify_func(func: Callable[P, Coro[T]]) -> Callable[P, T]:
 
         .. code:: py
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.new_event_loop()
             loop.run_until_complete(coroutine_func())
 
+        except the loop is created once per thread and reused for every call in that thread.
+
     .. warning::
-        There must be a running event loop to call it.
+        This cannot be called while an event loop is running in the current thread.
 
     Raises
     -------
     TypeError
         The object passed was not a coroutine function.
     """
-    if not inspect.iscoroutinefunction(func):
+    if not _is_coroutine_function(func):
         raise TypeError(f'Expected a callable coroutine function, got {func.__class__.__name__!r}')
 
-    @functools.wraps(func)
     def sync_func(*args: P.args, **kwargs: P.kwargs) -> T:
-        loop = asyncio.get_running_loop()
-        return loop.run_until_complete(func(*args, **kwargs))
+        return _get_sync_loop().run_until_complete(func(*args, **kwargs))
+
+    _copy_metadata(sync_func, func)
 
     return sync_func
 
@@ -155,7 +287,7 @@ class taskify_func(Generic[T]):
     """
 
     def __init__(self, func: Callable[..., Coro[T]]):
-        if not inspect.iscoroutinefunction(func):
+        if not _is_coroutine_function(func):
             raise TypeError(f'Expected a callable coroutine function, got {func.__class__.__name__!r}')
 
         self.func = func
@@ -169,9 +301,12 @@ class taskify_func(Generic[T]):
         return f'taskify_func({self.func!r})'
 
     def __get__(self, instance: object, owner: type) -> Self:
-        new_self = self.__class__(self.func)
+        # copy without re-running __init__ so the coroutine check and
+        # functools.update_wrapper do not run again per attribute access
+        new_self = self.__class__.__new__(self.__class__)
+        new_self.__dict__ = self.__dict__.copy()
         new_self._done_callbacks = self._done_callbacks
-        new_self._instance = self
+        new_self._instance = instance
         return new_self
 
     def __call__(self, *args: Any, **kwargs: Any) -> asyncio.Task[T]:
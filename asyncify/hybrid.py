@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import inspect
+import linecache
 import re
-from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, Union
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, Union
+
+from .func import _is_coroutine_function
 
 if TYPE_CHECKING:
     from types import FrameType
@@ -13,10 +17,44 @@ if TYPE_CHECKING:
 __all__ = ('HybridFunction',)
 
 
+_DISPATCH_CACHE_MAX = 128
+
+
 T_sync = TypeVar('T_sync')
 T_async = TypeVar('T_async')
 
 
+class _BoundHybrid(Generic[T_sync, T_async]):
+    # lightweight stand-in for a bound method so that attribute access does
+    # not re-run HybridFunction.__init__ (type checks + regex compile)
+
+    __slots__ = ('_hybrid', '_instance')
+
+    def __init__(self, hybrid: HybridFunction[T_sync, T_async], instance: object):
+        self._hybrid = hybrid
+        self._instance = instance
+
+    def __repr__(self) -> str:
+        return f'<bound hybrid function {self._hybrid._name!r} of {self._instance!r}>'
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and other._hybrid == self._hybrid
+            and other._instance is self._instance
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._hybrid, id(self._instance)))
+
+    @property
+    def __name__(self) -> str:
+        return self._hybrid._name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Union[T_sync, Coro[T_async]]:
+        return self._hybrid._call_with_instance(self._instance, *args, **kwargs)
+
+
 class HybridFunction(Generic[T_sync, T_async]):
     """
     Do multiple things depending on whether it was awaited or not!
@@ -59,8 +97,7 @@ class HybridFunction(Generic[T_sync, T_async]):
         Make the to name the function uniquely. Functions with the same name could be called unexpectedly.
     """
 
-    regex = re.compile(r'await\s+(\w|\.)*\s*\(.*\)')
-    name_regex: re.Pattern[str]
+    await_regex: re.Pattern[str]
 
     def __init__(
         self,
@@ -71,7 +108,9 @@ class HybridFunction(Generic[T_sync, T_async]):
         if not inspect.isfunction(sync_callback):
             raise TypeError(f'Expected callable function, got {sync_callback.__class__.__name__!r}')
 
-        if not inspect.iscoroutinefunction(async_callback):
+        # co_flags + marker check so compiled (cython/mypyc) coroutine
+        # functions marked with inspect.markcoroutinefunction pass too
+        if not _is_coroutine_function(async_callback):
             raise TypeError(
                 f'Expected a callable coroutine function, got {async_callback.__class__.__name__!r}'
             )
@@ -80,9 +119,12 @@ class HybridFunction(Generic[T_sync, T_async]):
         self.sync_callback = sync_callback
         self.async_callback = async_callback
 
-        self._instance: Optional[object] = None
+        # anchored to the name with a non-capturing character class to avoid backtracking
+        self.await_regex = re.compile(rf'await\s+[\w.]*\b{re.escape(self._name)}\s*\(')
 
-        self.name_regex = re.compile(rf'\(*{self._name}\)*\s*')
+        # the caller's source line is immutable per (filename, lineno), so the
+        # sync-vs-async decision can be reused after the first call
+        self._dispatch_cache: Dict[Tuple[str, int], bool] = {}
 
     def __repr__(self) -> str:
         return f'HybridFunction({self._name!r}, {self.sync_callback!r}, {self.async_callback!r})'
@@ -99,33 +141,44 @@ class HybridFunction(Generic[T_sync, T_async]):
             and other.async_callback is self.async_callback
         )
 
-    def __get__(self, instance: object, owner: type) -> Self:
-        new_self = self.__class__(self._name, self.sync_callback, self.async_callback)
-        new_self._instance = instance
-        return new_self
-
-    def _check_regex(self, code_context: str) -> bool:
-        search = self.regex.search(code_context)
-        if not search:
-            return False
-        return True
-
-    def _get_frame(self, current_frame: FrameType) -> str:
-        for frame in inspect.getouterframes(current_frame):
-            if not frame.code_context:
-                continue
-            if self.name_regex.search(frame.code_context[0]):
-                return frame.code_context[0]
+    def __hash__(self) -> int:
+        return hash((self._name, self.sync_callback, self.async_callback))
+
+    def __get__(self, instance: object, owner: type) -> Union[Self, _BoundHybrid[T_sync, T_async]]:
+        if instance is None:
+            return self
+        return _BoundHybrid(self, instance)
+
+    def _get_caller_frame(self) -> Tuple[FrameType, str]:
+        # skip _get_caller_frame, _call_with_instance and __call__
+        frame = sys._getframe(3)
+
+        while frame is not None:
+            line = linecache.getline(frame.f_code.co_filename, frame.f_lineno)
+            if self._name in line:
+                return frame, line
+            frame = frame.f_back
         raise RuntimeError('Could not tell if it should call sync or async.')
 
     def __call__(self, *args: Any, **kwargs: Any) -> Union[T_sync, Coro[T_async]]:
-        if self._instance:
-            args = (self._instance, *args)
+        return self._call_with_instance(None, *args, **kwargs)
+
+    def _call_with_instance(
+        self, instance: Optional[object], *args: Any, **kwargs: Any
+    ) -> Union[T_sync, Coro[T_async]]:
+        if instance is not None:
+            args = (instance, *args)
+
+        frame, line = self._get_caller_frame()
 
-        frame = inspect.currentframe()
-        assert frame is not None
+        key = (frame.f_code.co_filename, frame.f_lineno)
+        awaited = self._dispatch_cache.get(key)
+        if awaited is None:
+            awaited = self.await_regex.search(line) is not None
+            if len(self._dispatch_cache) >= _DISPATCH_CACHE_MAX:
+                self._dispatch_cache.clear()
+            self._dispatch_cache[key] = awaited
 
-        code_context = self._get_frame(frame).strip()
-        if self._check_regex(code_context):
+        if awaited:
             return self.async_callback(*args, **kwargs)
         return self.sync_callback(*args, **kwargs)